@@ -3,7 +3,7 @@ import json
 from pathlib import Path
 from typing import Union
 
-from supersetapiplus.base.base import raise_for_status
+from supersetapiplus.base.base import raise_for_status, EXPORT_CHUNK_SIZE
 
 
 class Assets:
@@ -27,15 +27,15 @@ class Assets:
 
     def export(self, path: Union[Path, str]) -> None:
         """Export object into an importable file"""
-        response = self.client.get(self.export_url)
-        raise_for_status(response)
+        with self.client.get(self.export_url, stream=True) as response:
+            raise_for_status(response)
 
-        content_type = response.headers["content-type"].strip()
-        if content_type.startswith("application/zip"):
-            data = response.content
-            with open(path, "wb") as f:
-                f.write(data)
-            return
+            content_type = response.headers["content-type"].strip()
+            if content_type.startswith("application/zip"):
+                with open(path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=EXPORT_CHUNK_SIZE):
+                        f.write(chunk)
+                return
         raise ValueError(f"Unknown content type {content_type}")
 
     def import_file(self, file_path, passwords=None) -> bool:
@@ -2,7 +2,10 @@
 import dataclasses
 import logging
 from abc import abstractmethod, ABC
+from contextvars import ContextVar
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 from typing_extensions import Self
 
@@ -17,7 +20,6 @@ import os.path
 from pathlib import Path
 from typing import List, Union, Dict, get_origin
 
-import yaml
 from requests import HTTPError
 
 from supersetapiplus.exceptions import BadRequestError, ComplexBadRequestError, MultipleFound, NotFound, \
@@ -29,6 +31,43 @@ from supersetapiplus.utils import dict_hash
 
 logger = logging.getLogger(__name__)
 
+# Tamanho dos blocos usados ao gravar exportações ZIP em disco.
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+_skip_validation: ContextVar[bool] = ContextVar('supersetapiplus_skip_validation', default=False)
+
+
+class SkipValidation:
+    """
+    Gerenciador de contexto que desativa a validação executada por `SerializableModel.to_json`.
+
+    Destinado a código confiável que monta gráficos e consultas programaticamente e já garante
+    a consistência dos objetos, evitando percorrer novamente as validações a cada serialização.
+    O estado é mantido em uma `ContextVar`, sendo isolado por thread e por tarefa assíncrona.
+
+    Exemplo:
+        >>> with SkipValidation():
+        ...     payload = chart.to_json()
+    """
+
+    def __init__(self):
+        # Pilha de tokens: a mesma instância pode ser aninhada ou reutilizada.
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_skip_validation.set(True))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _skip_validation.reset(self._tokens.pop())
+
+
+@lru_cache(maxsize=None)
+def _object_field_metadata(cls, dict_left, dict_right):
+    # Metadados somente leitura, compartilhados entre os campos de mesma configuração.
+    return MappingProxyType({"cls": cls, "dict_left": dict_left, "dict_right": dict_right})
+
 
 def object_field(*, cls=None, default=dataclasses.MISSING, default_factory=dataclasses.MISSING,
                  init=True, repr=True, hash=None, compare=True,
@@ -67,12 +106,10 @@ def object_field(*, cls=None, default=dataclasses.MISSING, default_factory=datac
         raise ValueError('cannot specify both default and default_factory')
 
     # Inicializa metadados, garantindo inclusão das chaves específicas
-    metadata = metadata or {}
-    metadata.update({
-        "cls": cls,
-        "dict_left": dict_left,
-        "dict_right": dict_right,
-    })
+    if metadata:
+        metadata = {**metadata, "cls": cls, "dict_left": dict_left, "dict_right": dict_right}
+    else:
+        metadata = _object_field_metadata(cls, dict_left, dict_right)
 
     # Retorna o campo com todos os parâmetros configurados
     return dataclasses.field(
@@ -116,6 +153,10 @@ class ObjectDecoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Instância reutilizada na serialização dos JSON_FIELDS, evitando criar um encoder a cada chamada.
+_object_encoder = ObjectDecoder()
+
+
 def json_field(**kwargs):
     """
     Cria um campo para dataclass que será utilizado para armazenar estruturas JSON.
@@ -222,35 +263,39 @@ def raise_for_status(response):
         response.raise_for_status()
     except HTTPError as e:
         request = response.request
-        request_headers = '\n'.join(f'{k}: {v}' for k, v in request.headers.items())
-        response_headers = '\n'.join(f'{k}: {v}' for k, v in response.headers.items())
 
-        # Tenta obter o corpo da resposta como texto
-        try:
-            response_body = response.text
-        except Exception:
-            response_body = "<não foi possível decodificar o corpo da resposta>"
-
-        # Log detalhado da requisição e resposta
-        logger.error("Erro na requisição HTTP")
-        logger.error(f"Request URL: {request.url}")
-        logger.error(f"Request Method: {request.method}")
-        logger.error(f"Request Headers:\n{request_headers}")
-        logger.error(f"Request Body:\n{request.body or '<vazio>'}")
-        logger.error(f"Response Status Code: {response.status_code}")
-        logger.error(f"Response Headers:\n{response_headers}")
-        logger.error(f"Response Body:\n{response_body}")
-
-        # Tentativas de extrair mensagens específicas da resposta JSON
-        try:
-            error_msg = response.json().get("message")
-        except Exception:
-            error_msg = None
+        # Log detalhado da requisição e resposta, montado apenas se o nível ERROR estiver ativo
+        if logger.isEnabledFor(logging.ERROR):
+            request_headers = '\n'.join([f'{k}: {v}' for k, v in request.headers.items()])
+            response_headers = '\n'.join([f'{k}: {v}' for k, v in response.headers.items()])
 
+            # Tenta obter o corpo da resposta como texto
+            try:
+                response_body = response.text
+            except Exception:
+                response_body = "<não foi possível decodificar o corpo da resposta>"
+
+            # Um único registro: evita sete passagens pelos handlers e mantém o bloco contíguo
+            logger.error(
+                "Erro na requisição HTTP\n"
+                f"Request URL: {request.url}\n"
+                f"Request Method: {request.method}\n"
+                f"Request Headers:\n{request_headers}\n"
+                f"Request Body:\n{request.body or '<vazio>'}\n"
+                f"Response Status Code: {response.status_code}\n"
+                f"Response Headers:\n{response_headers}\n"
+                f"Response Body:\n{response_body}"
+            )
+
+        # Tentativas de extrair mensagens específicas da resposta JSON (decodificada uma única vez)
         try:
-            errors = response.json().get("errors")
+            payload = response.json()
         except Exception:
-            errors = None
+            payload = None
+        error_msg = errors = None
+        if isinstance(payload, dict):
+            error_msg = payload.get("message")
+            errors = payload.get("errors")
 
         # Lança exceções específicas baseadas nos campos presentes
         if errors:
@@ -312,13 +357,32 @@ class SerializableModel(ParseMixin, ABC):
             if isinstance(value, str):
                 setattr(self, f, json.loads(value))
 
-        # Itera sobre todos os campos da dataclass
-        for field in self.fields():
-            # Se o campo tem valor padrão, está como None e não é SerializableOptional, define seu valor padrão
-            if not isinstance(field.default, dataclasses._MISSING_TYPE) \
-                    and getattr(self, field.name) is None \
-                    and not get_origin(field.type) is SerializableOptional:
-                setattr(self, field.name, field.default)
+        # Se o campo tem valor padrão, está como None e não é SerializableOptional, define seu valor padrão
+        for name, default in self._post_init_defaults():
+            if getattr(self, name) is None:
+                setattr(self, name, default)
+
+    @classmethod
+    def _post_init_defaults(cls) -> tuple:
+        """
+        Retorna os pares `(nome, default)` dos campos que o `__post_init__` deve preencher.
+
+        São considerados apenas campos com valor padrão definido e que não sejam `SerializableOptional`.
+        Campos cujo padrão é um membro de Enum ficam de fora: eles eram declarados com `default_factory`
+        e um `None` passado explicitamente (ou vindo de `from_json`) deve ser preservado.
+        O resultado é calculado uma única vez por classe, evitando percorrer todos os campos a cada instância.
+
+        Returns:
+            tuple: Tupla de pares `(nome do campo, valor padrão)`.
+        """
+        defaults = cls.__dict__.get('_post_init_defaults_cache')
+        if defaults is None:
+            defaults = tuple((field.name, field.default) for field in cls.fields()
+                             if not isinstance(field.default, dataclasses._MISSING_TYPE)
+                             and not isinstance(field.default, Enum)
+                             and not get_origin(field.type) is SerializableOptional)
+            cls._post_init_defaults_cache = defaults
+        return defaults
 
     @property
     def extra_fields(self):
@@ -384,46 +448,63 @@ class SerializableModel(ParseMixin, ABC):
         return dict_hash(dict_self)
 
     @classmethod
-    def fields(cls) -> set:
+    def _fields_by_name(cls) -> dict:
         """
-        Retorna o conjunto de campos definidos na dataclass.
+        Retorna um dicionário `{nome: dataclasses.Field}` com os campos definidos na dataclass.
 
-        Este método combina os campos definidos explicitamente na metaclasse
-        `__dataclass_fields__` com os campos obtidos por meio da função `dataclasses.fields`.
-        É utilizado para recuperar todas as declarações de atributos da classe herdada de `Object`.
+        Combina os campos definidos explicitamente na metaclasse `__dataclass_fields__` com os
+        campos obtidos por meio da função `dataclasses.fields` (que pode incluir heranças).
+        O resultado é calculado uma única vez por classe e reutilizado por `fields`, `get_field`
+        e `field_names`.
 
         Returns:
-            set: Conjunto de objetos do tipo `dataclasses.Field` representando os campos da classe.
+            dict: Mapeamento do nome de cada campo para o respectivo `dataclasses.Field`.
         """
-        _fields = set()
+        fields_by_name = cls.__dict__.get('_fields_by_name_cache')
+        if fields_by_name is None:
+            fields_by_name = {}
 
-        # Adiciona campos definidos diretamente na metaclasse
-        for n, f in cls.__dataclass_fields__.items():
-            if isinstance(f, dataclasses.Field):
-                _fields.add(f)
+            # Adiciona campos definidos diretamente na metaclasse
+            for n, f in cls.__dataclass_fields__.items():
+                if isinstance(f, dataclasses.Field):
+                    fields_by_name[f.name] = f
 
-        # Adiciona também os campos descobertos via dataclasses.fields (pode incluir heranças)
-        _fields.update(dataclasses.fields(cls))
+            # Adiciona também os campos descobertos via dataclasses.fields (pode incluir heranças)
+            for f in dataclasses.fields(cls):
+                fields_by_name[f.name] = f
 
-        return _fields
+            cls._fields_by_name_cache = fields_by_name
+            cls._fields_cache = frozenset(fields_by_name.values())
+            # Ignora campos cujo default é uma instância de Object
+            cls._field_names_cache = tuple(f.name for f in fields_by_name.values()
+                                           if not isinstance(f.default, SerializableModel))
+        return fields_by_name
+
+    @classmethod
+    def fields(cls) -> frozenset:
+        """
+        Retorna o conjunto de campos definidos na dataclass.
+
+        É utilizado para recuperar todas as declarações de atributos da classe herdada de `Object`.
+
+        Returns:
+            frozenset: Conjunto de objetos do tipo `dataclasses.Field` representando os campos da classe.
+        """
+        cls._fields_by_name()
+        return cls._fields_cache
 
     @classmethod
     def get_field(cls, name):
         """
         Retorna o campo da dataclass com o nome fornecido.
 
-        Este método percorre todos os campos definidos na dataclass e retorna
-        aquele cujo nome coincide com o argumento fornecido.
-
         Args:
             name (str): Nome do campo a ser localizado.
 
         Returns:
             dataclasses.Field: Campo correspondente ao nome fornecido, ou None se não encontrado.
         """
-        for f in cls.fields():
-            if f.name == name:
-                return f
+        return cls._fields_by_name().get(name)
 
     @classmethod
     def field_names(cls) -> list:
@@ -436,12 +517,8 @@ class SerializableModel(ParseMixin, ABC):
         Returns:
             list: Lista de strings contendo os nomes dos campos relevantes.
         """
-        fields = []
-        for f in cls.fields():
-            # Ignora campos cujo default é uma instância de Object
-            if not isinstance(f.default, SerializableModel):
-                fields.append(f.name)
-        return fields
+        cls._fields_by_name()
+        return list(cls._field_names_cache)
 
     @classmethod
     def required_fields(cls, data) -> dict:
@@ -530,6 +607,27 @@ class SerializableModel(ParseMixin, ABC):
         # Se nenhuma das abordagens funcionar, retorna None
         return None
 
+    @classmethod
+    def _object_fields(cls) -> dict:
+        """
+        Retorna um dicionário `{nome do campo: classe}` com os campos que referenciam subclasses de `Object`.
+
+        A resolução via `_subclass_object` é feita uma única vez por classe, evitando consultar
+        a metadata e a `default_factory` de cada campo a cada desserialização.
+
+        Returns:
+            dict: Mapeamento do nome do campo para a classe usada na sua desserialização.
+        """
+        object_fields = cls.__dict__.get('_object_fields_cache')
+        if object_fields is None:
+            object_fields = {}
+            for field in cls.fields():
+                ObjectClass = cls._subclass_object(field)
+                if ObjectClass:
+                    object_fields[field.name] = ObjectClass
+            cls._object_fields_cache = object_fields
+        return object_fields
+
     @classmethod
     def from_json(cls, data: dict) -> Self:
         """
@@ -552,6 +650,8 @@ class SerializableModel(ParseMixin, ABC):
                             tipo ou parsing de campos compostos.
          """
         extra_fields = cls.__get_extra_fields(data) # Separa campos não definidos na classe
+        # Evita formatar as mensagens de debug (e o repr de cada valor) quando o nível não está ativo
+        debug = logger.isEnabledFor(logging.DEBUG)
         field_name = None
         field_value = None
         data_value = None
@@ -563,11 +663,11 @@ class SerializableModel(ParseMixin, ABC):
 
             # Trata os campos explicitamente listados como JSON_FIELDS
             for field_name in cls.JSON_FIELDS:
-                logger.debug(f'field_name: {field_name} found in JSON_FIELDS')
+                if debug:
+                    logger.debug(f'field_name: {field_name} found in JSON_FIELDS')
                 data_value = data.get(field_name)
                 if isinstance(data_value, str):
-                    field = cls.get_field(field_name)
-                    ObjectClass = cls._subclass_object(field)
+                    ObjectClass = cls._object_fields().get(field_name)
                     if ObjectClass:
                         value = ObjectClass.from_json(json.loads(data[field_name]))
                     else:
@@ -577,14 +677,14 @@ class SerializableModel(ParseMixin, ABC):
 
             # Itera sobre todos os campos restantes no dicionário
             for field_name, data_value in data.items():
-                logger.debug(f'field_name: {field_name}; data_value type: {type(data_value)}; data_value: {data_value}')
+                if debug:
+                    logger.debug(f'field_name: {field_name}; data_value type: {type(data_value)}; data_value: {data_value}')
                 if field_name in cls.JSON_FIELDS:
                     continue
                 if isinstance(data_value, dict):
-                    field = cls.get_field(field_name)
-                    ObjectClass = cls._subclass_object(field)
+                    ObjectClass = cls._object_fields().get(field_name)
                     value = None
-                    if ObjectClass and field.metadata.get('dict_right'):
+                    if ObjectClass and cls.get_field(field_name).metadata.get('dict_right'):
                         # Campo do tipo dict[str, Object]
                         value = {}
                         for k, field_value in data_value.items():
@@ -597,8 +697,7 @@ class SerializableModel(ParseMixin, ABC):
                         value = data_value
                     setattr(obj, field_name, value)
                 elif isinstance(data_value, list):
-                    field = cls.get_field(field_name)
-                    ObjectClass = cls._subclass_object(field)
+                    ObjectClass = cls._object_fields().get(field_name)
                     value = []
                     for field_value in data_value:
                         if ObjectClass and isinstance(field_value, dict):
@@ -775,7 +874,7 @@ class SerializableModel(ParseMixin, ABC):
                         values_data.append(str(field_value))
                     else:
                         values_data.append(field_value)
-                    value = values_data
+                value = values_data
 
             # Converte dicionários de objetos baseados em metadados
             elif value and isinstance(value, dict):
@@ -817,29 +916,36 @@ class SerializableModel(ParseMixin, ABC):
         data = self.to_dict(columns)
 
         # Executa a validação do dicionário serializado, se implementada na subclasse
-        self.validate(data)
+        if not _skip_validation.get():
+            self.validate(data)
 
         # Campos que devem ser serializados como JSON string (definidos em JSON_FIELDS)
         for field in self.JSON_FIELDS:
             obj = getattr(self, field)
             if isinstance(obj, SerializableModel):
                 # Converte o campo para JSON usando serialização recursiva personalizada
-                data[field] = json.dumps(obj.to_json(), cls=ObjectDecoder)
+                data[field] = _object_encoder.encode(obj.to_json())
             elif isinstance(obj, dict):
                 # Serializa dicionários também usando o ObjectDecoder (tratamento especial para Enum, etc.)
-                data[field] = json.dumps(data[field], cls=ObjectDecoder)
+                data[field] = _object_encoder.encode(data[field])
+
+        # As mensagens de debug formatam o payload inteiro; só monta quando o nível está ativo
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Remove do dicionário os campos que devem ser excluídos da serialização
-        logger.debug(f'Remove do dicionário os campos que devem ser excluídos da serialização: remove_exclude_keys: {data}')
+        if debug:
+            logger.debug(f'Remove do dicionário os campos que devem ser excluídos da serialização: remove_exclude_keys: {data}')
         copydata = self.remove_exclude_keys(data)
 
         # Remove campo técnico "_extra_fields" se ainda presente
-        logger.debug(f'remove campo técnico _extra_fields: {copydata}')
+        if debug:
+            logger.debug(f'remove campo técnico _extra_fields: {copydata}')
         if copydata.get('extra_fields'):
             copydata.pop('extra_fields')
 
         # Loga a estrutura final antes de retornar
-        logger.debug(f'return data {copydata}')
+        if debug:
+            logger.debug(f'return data {copydata}')
         return copydata
 
     @property
@@ -1125,24 +1231,27 @@ class ApiModelFactories(ABC):
             path (Path | str): Caminho do arquivo de destino.
         """
         ids_array = ",".join([str(i) for i in ids])
-        response = self.client.get(self.export_url, params={"q": f"[{ids_array}]"})
-        raise_for_status(response)
-        content_type = response.headers["content-type"].strip()
-
-        if content_type.startswith("application/text"):
-            data = yaml.load(response.text, Loader=yaml.FullLoader)
-            with open(path, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, default_flow_style=False)
-        elif content_type.startswith("application/json"):
-            data = response.json()
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-        elif content_type.startswith("application/zip"):
-            data = response.content
-            with open(path, "wb") as f:
-                f.write(data)
-        else:
-            raise ValueError(f"Unknown content type {content_type}")
+        # stream=True: o ZIP é gravado em blocos, sem manter o arquivo inteiro em memória.
+        with self.client.get(self.export_url, params={"q": f"[{ids_array}]"}, stream=True) as response:
+            raise_for_status(response)
+            content_type = response.headers["content-type"].strip()
+
+            if content_type.startswith("application/text"):
+                # Importado aqui: o PyYAML só é necessário nesta exportação.
+                import yaml
+                data = yaml.load(response.text, Loader=yaml.FullLoader)
+                with open(path, "w", encoding="utf-8") as f:
+                    yaml.dump(data, f, default_flow_style=False)
+            elif content_type.startswith("application/json"):
+                data = response.json()
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=4)
+            elif content_type.startswith("application/zip"):
+                with open(path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=EXPORT_CHUNK_SIZE):
+                        f.write(chunk)
+            else:
+                raise ValueError(f"Unknown content type {content_type}")
 
     def delete(self, id: int) -> bool:
         """
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from supersetapiplus.base.base import SerializableModel
 from supersetapiplus.base.types import DatasourceType
@@ -7,4 +7,4 @@ from supersetapiplus.base.types import DatasourceType
 @dataclass
 class DataSource(SerializableModel):
     id: int = None
-    type: DatasourceType = field(default_factory=lambda: DatasourceType.TABLE)
\ No newline at end of file
+    type: DatasourceType = DatasourceType.TABLE
\ No newline at end of file
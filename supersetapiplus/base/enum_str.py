@@ -4,6 +4,10 @@ class StringEnum(Enum):
     def __str__(self):
         return str(self.value)
 
+    # Overriding __eq__ drops the inherited __hash__; keep members hashable so they
+    # can be used as plain dataclass defaults and as cache keys.
+    __hash__ = Enum.__hash__
+
     def __eq__(self, other):
         if str(self.__class__) == str(other.__class__):
             return self.value == other.value
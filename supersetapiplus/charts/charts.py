@@ -1,9 +1,8 @@
 """Charts."""
 import copy
 import json
-from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Type
+from typing import Iterable, List, Type
 
 from typing_extensions import Self
 
@@ -40,16 +39,20 @@ class Chart(SerializableModel):
     params: Option = field(init=False)  # Não instanciar Option diretamente!
     query_context: QueryContext = object_field(cls=QueryContext, default_factory=QueryContext)
 
-    datasource_type: DatasourceType = field(default_factory=lambda: DatasourceType.TABLE)
+    datasource_type: DatasourceType = DatasourceType.TABLE
     dashboards: List[Dashboard] = object_field(cls=Dashboard, default_factory=list)
 
 
     _slice_name_override: SerializableNotToJson[str] = default_string()
 
-    @classmethod
-    @abstractmethod
-    def _default_option_class(cls) -> type[Option]:
-        ...
+    # Option class used when no params are given; every subclass must define it.
+    # Left unannotated so it does not become a dataclass (pseudo-)field.
+    _default_option_class = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not isinstance(getattr(cls, '_default_option_class', None), type):
+            raise TypeError(f'{cls.__name__} must define the _default_option_class class attribute.')
 
     def __post_init__(self):
         super().__post_init__()
@@ -57,7 +60,7 @@ class Chart(SerializableModel):
         self._dashboards = [Dashboard(dashboard_title='')]
 
         if not hasattr(self, "params") or self.params is None:
-            self.params = self._default_option_class()()  # Assume que existe esse método na subclasse concreta
+            self.params = self._default_option_class()  # Definido em cada subclasse concreta
 
         if self.id is None:
             if self.datasource_id is None:
@@ -87,7 +90,7 @@ class Chart(SerializableModel):
                  options: Option = None):
 
         if options is None:
-            options = cls._default_option_class()()  # delega para a subclasse
+            options = cls._default_option_class()  # delega para a subclasse
 
         new_chart = cls(slice_name=slice_name,
                         datasource_id=datasource.id,
@@ -133,6 +136,13 @@ class Chart(SerializableModel):
         self.params._add_simple_metric(metric, automatic_order)
         self.query_context._add_simple_metric(metric, automatic_order)
 
+    def add_simple_metrics(self, metrics: Iterable[MetricType], automatic_order: OrderBy = OrderBy()):
+        metrics = tuple(metrics)
+        params = self.params
+        for metric in metrics:
+            params._add_simple_metric(metric, automatic_order)
+        self.query_context._add_simple_metrics(metrics, automatic_order)
+
     def add_custom_metric(self, label: str,
                           automatic_order: OrderBy = OrderBy(),
                           column: AdhocMetricColumn = None,
@@ -159,6 +169,11 @@ class Chart(SerializableModel):
         self.params._add_simple_groupby(column_name)
         self.query_context._add_simple_groupby(column_name)
 
+    def add_simple_dimensions(self, column_names: Iterable[str]):
+        column_names = tuple(column_names)
+        self.params._add_simple_groupby_bulk(column_names)
+        self.query_context._add_simple_groupby_bulk(column_names)
+
     def add_custom_dimension(self, label: str,
                              column: AdhocMetricColumn = None,
                              sql_expression: str = None,
@@ -178,6 +193,16 @@ class Chart(SerializableModel):
                                               value=value,
                                               operator=operator)
 
+    def add_simple_filters(self, filters: Iterable[tuple[str, str, FilterOperatorType]]) -> None:
+        filters = tuple(filters)
+        for column_name, value, operator in filters:
+            self.params._adhoc_filters(expression_type=FilterExpressionType.SIMPLE,
+                                       clause=FilterClausesType.WHERE,
+                                       subject=column_name,
+                                       comparator=value,
+                                       operator=operator)
+        self.query_context._add_simple_filters_bulk(filters)
+
     def add_extra_where(self, sql: str):
         self.params._adhoc_filters(expression_type=FilterExpressionType.CUSTOM_SQL,
                                    clause=FilterClausesType.WHERE,
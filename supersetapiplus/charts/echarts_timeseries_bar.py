@@ -15,7 +15,7 @@ from supersetapiplus.typing import SerializableOptional
 
 @dataclass
 class TimeSeriesBarOption(Option):
-    viz_type: ChartType = field(default_factory=lambda: ChartType.TIMESERIES_BAR)
+    viz_type: ChartType = ChartType.TIMESERIES_BAR
     color_scheme: str = default_string(default='supersetColors')
 
     time_grain_sqla: SerializableOptional[TimeGrain] = field(default_factory=lambda: TimeGrain.DAY)
@@ -23,43 +23,43 @@ class TimeSeriesBarOption(Option):
     x_axis: AdhocMetric = object_field(cls=AdhocMetric, default_factory=AdhocMetric)
     x_axis_sort_asc: bool = True
 
-    x_axis_sort_series: SortSeriesType = field(default_factory=lambda: SortSeriesType.NAME)
+    x_axis_sort_series: SortSeriesType = SortSeriesType.NAME
     x_axis_sort_series_ascending: bool = True
 
-    contributionMode: ContributionType = field(default_factory=lambda: ContributionType.ROW)
+    contributionMode: ContributionType = ContributionType.ROW
     order_desc: bool = True
     row_limit: int = 1000
     truncate_metric: bool = True
-    comparison_type: ComparisonType = field(default_factory=lambda: ComparisonType.VALUES)
+    comparison_type: ComparisonType = ComparisonType.VALUES
     annotation_layers: List = field(default_factory=list)
     forecastPeriods: int = 10
     forecastInterval: float = 0.8
-    orientation: Orientation = field(default_factory=lambda: Orientation.HORIZONTAL)
+    orientation: Orientation = Orientation.HORIZONTAL
     x_axis_title: str = default_string(default=' ')
     x_axis_title_margin: int = 30
     y_axis_title: str = default_string(default='')
     y_axis_title_margin: int = 30
-    y_axis_title_position: TitlepositionType = field(default_factory=lambda: TitlepositionType.LEFT)
-    sort_series_type: SortSeriesType = field(default_factory=lambda: SortSeriesType.NAME)
+    y_axis_title_position: TitlepositionType = TitlepositionType.LEFT
+    sort_series_type: SortSeriesType = SortSeriesType.NAME
     sort_series_ascending: bool = True
     show_value: bool = False
-    stack: StackStylyType = field(default_factory=lambda: StackStylyType.STACK)
+    stack: StackStylyType = StackStylyType.STACK
     only_total: bool = True
     percentage_threshold: int = 0
     show_legend: bool = True
-    legendType: LegendType = field(default_factory=lambda: LegendType.SCROLL)
-    legendOrientation: LegendOrientationType = field(default_factory=lambda: LegendOrientationType.BOTTOM)
+    legendType: LegendType = LegendType.SCROLL
+    legendOrientation: LegendOrientationType = LegendOrientationType.BOTTOM
     legendMargin: int = 10
-    x_axis_time_format: DateFormatType = field(default_factory=lambda: DateFormatType.SMART_DATE)
-    xAxisLabelRotation: LabelRotation = field(default_factory=lambda: LabelRotation.ZERO)
-    y_axis_format: NumberFormatType = field(default_factory=lambda: NumberFormatType.SMART_NUMBER)
+    x_axis_time_format: DateFormatType = DateFormatType.SMART_DATE
+    xAxisLabelRotation: LabelRotation = LabelRotation.ZERO
+    y_axis_format: NumberFormatType = NumberFormatType.SMART_NUMBER
     currency_format: SerializableOptional[CurrencyFormat] = object_field(cls=CurrencyFormat, default_factory=CurrencyFormat)
     logAxis: bool = False
     minorSplitLine: bool = False
     truncateYAxis: bool = False
     y_axis_bounds: tuple[int, int] = field(default_factory=dict)
     rich_tooltip: bool = True
-    tooltipTimeFormat: DateFormatType = field(default_factory=lambda: DateFormatType.SMART_DATE)
+    tooltipTimeFormat: DateFormatType = DateFormatType.SMART_DATE
 
     # extra_form_data: {}
     # dashboards: [20]
@@ -101,16 +101,17 @@ class TimeSeriesBarQueryObject(QuerySerializableModel):
 
 @dataclass
 class TimeSeriesBarQueryContext(QueryContext):
+    _query_object_class = TimeSeriesBarQueryObject
+
     queries: List[TimeSeriesBarQueryObject] = object_field(cls=TimeSeriesBarQueryObject, default_factory=list)
     form_data: TimeSeriesBarFormData = object_field(cls=TimeSeriesBarFormData, default_factory=TimeSeriesBarFormData)
 
-    def _default_query_object_class(self) -> type[QuerySerializableModel]:
-        return TimeSeriesBarQueryObject
-
 
 @dataclass
 class EchartsTimeseriesBarChart(Chart):
-    viz_type: ChartType = field(default_factory=lambda: ChartType.TIMESERIES_BAR)
+    _default_option_class = TimeSeriesBarOption
+
+    viz_type: ChartType = ChartType.TIMESERIES_BAR
     params: TimeSeriesBarOption = object_field(cls=TimeSeriesBarOption, default_factory=TimeSeriesBarOption)
     query_context: TimeSeriesBarQueryContext = object_field(cls=TimeSeriesBarQueryContext,
                                                            default_factory=TimeSeriesBarQueryContext)
@@ -121,10 +122,6 @@ class EchartsTimeseriesBarChart(Chart):
                sort_series_by: SortSeriesType = SortSeriesType.NAME):
         self.params.y_axis(label, sql_expression, sort_ascending, sort_series_by)
 
-    @classmethod
-    def _default_option_class(cls) -> type[Option]:
-        return TimeSeriesBarOption
-
     # def add_custom_metric(self, label: str,
     #                       automatic_order: OrderBy = OrderBy(),
     #                       column: AdhocMetricColumn = None,
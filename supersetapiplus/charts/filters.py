@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from supersetapiplus.base.base import SerializableModel
 from supersetapiplus.charts.types import FilterOperatorType, FilterExpressionType, FilterClausesType
@@ -10,11 +10,11 @@ from supersetapiplus.typing import SerializableOptional
 
 @dataclass
 class AdhocFilterClause(SerializableModel):
-    expressionType: FilterExpressionType = field(default_factory=lambda: FilterExpressionType.SIMPLE)
+    expressionType: FilterExpressionType = FilterExpressionType.SIMPLE
     subject: str = None
     operator: FilterOperatorType = None
     comparator: str = None
-    clause: FilterClausesType = field(default_factory=lambda: FilterClausesType.WHERE)
+    clause: FilterClausesType = FilterClausesType.WHERE
     sqlExpression: str = None
     operatorId: SerializableOptional[str] = None
 
@@ -1,6 +1,6 @@
 import logging
-from dataclasses import dataclass, field
-from typing import Union, Literal, get_args, Protocol, runtime_checkable, List
+from dataclasses import dataclass
+from typing import Union, Literal, get_args, Protocol, List
 
 from supersetapiplus.base.base import SerializableModel, default_string, object_field
 from supersetapiplus.charts.types import FilterExpressionType, SqlMapType, \
@@ -46,8 +46,9 @@ class AdhocMetricColumn(SerializableModel):
 
 @dataclass
 class AdhocMetric(SerializableModel):
-    expressionType: FilterExpressionType = field(default_factory=lambda: FilterExpressionType.CUSTOM_SQL)
-    column: SerializableOptional[AdhocMetricColumn] = object_field(cls=AdhocMetricColumn, default_factory=AdhocMetricColumn)
+    expressionType: FilterExpressionType = FilterExpressionType.CUSTOM_SQL
+    # An empty column would be dropped in __post_init__ anyway, so avoid building one per instance.
+    column: SerializableOptional[AdhocMetricColumn] = object_field(cls=AdhocMetricColumn, default=None)
     label: SerializableOptional[str] = default_string()
     hasCustomLabel: SerializableOptional[bool] = False
     sqlExpression: SerializableOptional[str] = None
@@ -60,26 +61,45 @@ class AdhocMetric(SerializableModel):
         if isinstance(self.column, AdhocMetricColumn) and self.column.is_empty():
             self.column: SerializableOptional[AdhocMetricColumn] = None
 
+    @classmethod
+    def _fast_new(cls, expressionType, sqlExpression, label, hasCustomLabel, column, aggregate):
+        # Construction path for MetricHelper.get_metric: binds every field directly instead of
+        # going through the generated __init__ with a kwargs dict. Keep in sync with the fields above.
+        obj = object.__new__(cls)
+        obj.expressionType = expressionType
+        obj.column = column
+        obj.label = label
+        obj.hasCustomLabel = hasCustomLabel
+        obj.sqlExpression = sqlExpression
+        obj.aggregate = aggregate
+        obj.timeGrain = None
+        obj.columnType = None
+        obj.__post_init__()
+        return obj
+
+    def signature(self) -> tuple:
+        # Hashable identity of the metric, for membership checks that would otherwise walk every field.
+        column_name = self.column.column_name if self.column is not None else None
+        return self.label, self.sqlExpression, self.aggregate, str(self.expressionType), column_name
+
 
 Metric = Union[AdhocMetric, Literal['count', 'sum', 'avg', 'min', 'max', 'count distinct']]
 OrderByTyping = tuple[Metric, bool]
 
+# Literal options of Metric, resolved once instead of on every check_metric call.
+_SIMPLE_METRICS = get_args(get_args(Metric)[-1])
+_SIMPLE_METRICS_SET = frozenset(_SIMPLE_METRICS)
 
-class OrderBy:
-    def __init__(self, automate: bool = True, sort_ascending: bool = True):
-        self._automate = automate
-        self._sort_ascending = sort_ascending
+_ORDER_BY_STR = 'automate: {}, sort_ascending: {}'.format
 
-    def __str__(self):
-        return f'automate: {self._automate}, sort_ascending: {self._sort_ascending}'
 
-    @property
-    def automate(self):
-        self._automate
+@dataclass(frozen=True, slots=True)
+class OrderBy:
+    automate: bool = True
+    sort_ascending: bool = True
 
-    @property
-    def sort_ascending(self):
-        self._sort_ascending
+    def __str__(self):
+        return _ORDER_BY_STR(self.automate, self.sort_ascending)
 
 
 class MetricHelper:
@@ -100,24 +120,18 @@ class MetricHelper:
         if label:
             has_custom_label = True
 
-        _metric = {
-            "expressionType": str(expression_type),
-            "hasCustomLabel": has_custom_label,
-            'column': column,
-            'sqlExpression': sql_expression,
-            'aggregate': aggregate
-        }
-        if has_custom_label:
-            _metric['label'] = label
-
-        return AdhocMetric(**_metric)
+        return AdhocMetric._fast_new(expressionType=str(expression_type),
+                                     sqlExpression=sql_expression,
+                                     label=label if has_custom_label else '',
+                                     hasCustomLabel=has_custom_label,
+                                     column=column,
+                                     aggregate=aggregate)
 
     @classmethod
     def check_metric(cls, value):
-        simple_metrics = get_args(get_args(Metric)[-1])
-        if str(value) not in simple_metrics:
+        if str(value) not in _SIMPLE_METRICS_SET:
             raise ValidationError(message='Metric not found.',
-                                  solution=f'Use one of the options:{simple_metrics}')
+                                  solution=f'Use one of the options:{_SIMPLE_METRICS}')
 
     @classmethod
     def check_aggregate(cls, value):
@@ -127,7 +141,6 @@ class MetricHelper:
                                   solution=f'Use o enum types.MetricType')
 
 
-@runtime_checkable
 class SupportsMetrics(Protocol):
     # This is a protocol that defines the expected structure of classes that have metrics.
     metrics: List[Metric]
@@ -148,7 +161,6 @@ class MetricsListMixin:
         self.metrics.append(metric)
 
 
-@runtime_checkable
 class SupportsMetric(Protocol):
     # This is a protocol that defines the expected structure of classes that have metric.
     metric: Metric
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, runtime_checkable, Protocol
+from typing import List, Dict, Optional, Protocol, Sequence
 
 from supersetapiplus.base.base import SerializableModel, object_field
 from supersetapiplus.charts.filters import AdhocFilterClause
@@ -8,11 +8,11 @@ from supersetapiplus.charts.metric import OrderByTyping, AdhocMetricColumn, Metr
 from supersetapiplus.charts.types import ChartType, FilterOperatorType, FilterClausesType, \
     FilterExpressionType, MetricType
 from supersetapiplus.exceptions import ValidationError
+from supersetapiplus.utils import intern_str
 
 logger = logging.getLogger(__name__)
 
 
-@runtime_checkable
 class SupportsGroupBy(Protocol):
     # This is a protocol that defines the expected structure of classes that have metric.
     groupby: Optional[List[OrderByTyping]]
@@ -20,7 +20,10 @@ class SupportsGroupBy(Protocol):
 
 class OptionListGroupByMixin:
     def _add_simple_groupby(self: SupportsGroupBy, column_name:str):
-        self.groupby.append(column_name)
+        self.groupby.append(intern_str(column_name))
+
+    def _add_simple_groupby_bulk(self: SupportsGroupBy, column_names: Sequence[str]):
+        self.groupby.extend(map(intern_str, column_names))
 
     def _add_custom_groupby(self: SupportsGroupBy, label: str,
                             column: AdhocMetricColumn = None,
@@ -59,19 +62,20 @@ class Option(SerializableModel, OptionListGroupByMixin):
 
     def __post_init__(self):
         super().__post_init__()
-        if not self.groupby:
+        # default_factory already provides a fresh list; only an explicit None needs replacing.
+        if self.groupby is None:
             self.groupby: List[OrderByTyping] = []
 
     def validate(self, data: dict):
-        super().validate(data)
+        # Cheap local check first, so an empty groupby fails before walking the base validations.
         if not self.groupby:
             raise ValidationError(message='Field groupy cannot be empty.',
                                   solution='Use one of the add_simple_groupby or add_custom_groupby methods to add a groupby.')
+        super().validate(data)
 
     def add_dashboard(self, dashboard_id):
-        dashboards = set(self.dashboards)
-        dashboards.add(dashboard_id)
-        self.dashboards = list(dashboards)
+        if dashboard_id not in self.dashboards:
+            self.dashboards.append(dashboard_id)
 
     def _adhoc_filters(self,
                        expression_type: FilterExpressionType,
@@ -1,5 +1,5 @@
 """Charts."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List
 
 from supersetapiplus.base.base import default_string, object_field
@@ -15,18 +15,18 @@ from supersetapiplus.typing import SerializableOptional
 
 
 @dataclass
-class PieOption(Option, SingleMetricMixin):
-    viz_type: ChartType = field(default_factory=lambda: ChartType.PIE)
+class PieOption(SingleMetricMixin, Option):
+    viz_type: ChartType = ChartType.PIE
     color_scheme: str = default_string(default='supersetColors')
-    legendType: LegendType = field(default_factory=lambda: LegendType.SCROLL)
-    legendOrientation: LegendOrientationType = field(default_factory=lambda: LegendOrientationType.TOP)
-    label_type: LabelType = field(default_factory=lambda: LabelType.CATEGORY_NAME)
+    legendType: LegendType = LegendType.SCROLL
+    legendOrientation: LegendOrientationType = LegendOrientationType.TOP
+    label_type: LabelType = LabelType.CATEGORY_NAME
     show_legend: bool = True
     show_labels: bool = True
     legendMargin: SerializableOptional[str] = ''
     currency_format: SerializableOptional[CurrencyFormat] = object_field(cls=CurrencyFormat, default_factory=CurrencyFormat)
-    number_format: NumberFormatType = field(default_factory=lambda: NumberFormatType.SMART_NUMBER)
-    date_format: DateFormatType = field(default_factory=lambda: DateFormatType.SMART_DATE)
+    number_format: NumberFormatType = NumberFormatType.SMART_NUMBER
+    date_format: DateFormatType = DateFormatType.SMART_DATE
     donut: SerializableOptional[bool] = False
     label_line: SerializableOptional[bool] = False
     labels_outside: bool = True
@@ -46,8 +46,7 @@ class PieOption(Option, SingleMetricMixin):
             self.show_legend = True
         if self.label_line:
             self.labels_outside = True
-            self.show_labels = True
-        if self.labels_outside:
+        if self.labels_outside and not self.show_labels:
             self.show_labels = True
 
     def validate(self, data: dict):
@@ -74,55 +73,59 @@ class PieQueryObject(QuerySerializableModel):
 
 @dataclass
 class PieQueryContext(QueryContext):
+    _query_object_class = PieQueryObject
+
     form_data: PieFormData = object_field(cls=PieFormData, default_factory=PieFormData)
     queries: List[PieQueryObject] = object_field(cls=QuerySerializableModel, default_factory=list)
 
     def validate(self, data: dict):
         super().validate(data)
 
-        if self.form_data.metric or self.queries:
-            equals = False
-            for query in self.queries:
-                for metric in query.metrics:
-                    if self.form_data.metric == metric:
-                        equals = True
-                        break
-            if not equals:
-                raise ValidationError(message='The metric definition in formdata is not included in queries.metrics.',
-                                      solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
-
-        if self.automatic_order and self.automatic_order.automate:
-            equals = False
-            if self.form_data.metric or self.queries:
-                for query in self.queries:
-                    for order in query.orderby:
-                        if not isinstance(order, tuple):
+        form_data_metric = self.form_data.metric
+        if not (form_data_metric or self.queries):
+            return
+
+        check_orderby = self.automatic_order and self.automatic_order.automate
+        in_metrics = False
+        in_orderby = False
+        # Single pass over the queries for both the metrics and the orderby checks.
+        for query in self.queries:
+            if not in_metrics:
+                in_metrics = any(form_data_metric is metric or form_data_metric == metric for metric in query.metrics)
+            if check_orderby and not in_orderby:
+                for order in query.orderby:
+                    match order:
+                        case tuple((order_metric, *_)):
+                            if form_data_metric is order_metric or form_data_metric == order_metric:
+                                in_orderby = True
+                                break
+                        case _:
                             raise ValidationError('Order by must be a tuple.',
-                                                  slution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
-                        if self.form_data.metric == order[0]:
-                            equals = True
-                            break
+                                                  solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
+            if in_metrics and (in_orderby or not check_orderby):
+                break
 
-                if not equals:
-                    raise ValidationError(message='The metric definition in formdata is not included in queries.orderby.',
-                                          solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
+        if not in_metrics:
+            raise ValidationError(message='The metric definition in formdata is not included in queries.metrics.',
+                                  solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
 
-    def _default_query_object_class(self) -> type[QuerySerializableModel]:
-        return PieQueryObject
+        if check_orderby and not in_orderby:
+            raise ValidationError(message='The metric definition in formdata is not included in queries.orderby.',
+                                  solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
 
 
 @dataclass
 class PieChart(Chart):
-    viz_type: ChartType = field(default_factory=lambda: ChartType.PIE)
+    _default_option_class = PieOption
+
+    viz_type: ChartType = ChartType.PIE
     params: PieOption = object_field(cls=PieOption, default_factory=PieOption)
     query_context: PieQueryContext = object_field(cls=PieQueryContext, default_factory=PieQueryContext)
 
     def validate(self, data: dict):
         super().validate(data)
-        if (self.params.metric or self.query_context.form_data.metric) and not (self.params.metric == self.query_context.form_data.metric):
+        params_metric = self.params.metric
+        form_data_metric = self.query_context.form_data.metric
+        if (params_metric or form_data_metric) and not (params_metric == form_data_metric):
                 raise ValidationError(message='The metric definition in self.params.metric not equals self.query_context.form_data.metric.',
                                       solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
-
-    @classmethod
-    def _default_option_class(cls) -> type[Option]:
-        return PieOption
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass, field
-from typing import List, Union, Dict, Protocol, runtime_checkable
+from typing import List, Union, Dict, Protocol, Sequence
 
 from supersetapiplus.base.base import SerializableModel, object_field
 from supersetapiplus.charts.metric import AdhocMetricColumn, MetricHelper, Metric, OrderByTyping, MetricsListMixin, \
@@ -10,6 +10,7 @@ from supersetapiplus.charts.types import FilterOperatorType, TimeGrain, FilterEx
     ColumnType
 from supersetapiplus.exceptions import ValidationError
 from supersetapiplus.typing import FilterValues, SerializableOptional
+from supersetapiplus.utils import intern_str
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class CurrencyFormat(SerializableModel):
 
 @dataclass
 class ColumnConfig(SerializableModel):
-    horizontalAlign: HorizontalAlignType = field(default_factory=lambda: HorizontalAlignType.LEFT)
+    horizontalAlign: HorizontalAlignType = HorizontalAlignType.LEFT
     d3NumberFormat: SerializableOptional[NumberFormatType] = field(default_factory=lambda: NumberFormatType.ORIGINAL_VALUE)
     d3SmallNumberFormat: SerializableOptional[NumberFormatType] = field(default_factory=lambda: NumberFormatType.ORIGINAL_VALUE)
 
@@ -55,10 +56,9 @@ Column = Union[AdhocColumn, str]
 class QueryFilterClause(SerializableModel):
     col: Column
     val: SerializableOptional[FilterValues]
-    op: FilterOperatorType = field(default_factory=lambda: FilterOperatorType.EQUALS)
+    op: FilterOperatorType = FilterOperatorType.EQUALS
 
 
-@runtime_checkable
 class SupportsColumns(Protocol):
     # This is a protocol that defines the expected structure of classes that have metric.
     columns: SerializableOptional[List[Metric]]
@@ -66,7 +66,10 @@ class SupportsColumns(Protocol):
 
 class ColumnsMixin:
     def _add_simple_columns(self: SupportsColumns, column_name:str):
-        self.columns.append(column_name)
+        self.columns.append(intern_str(column_name))
+
+    def _add_simple_columns_bulk(self: SupportsColumns, column_names: Sequence[str]):
+        self.columns.extend(map(intern_str, column_names))
 
     def _add_custom_columns(self: SupportsColumns, label: str,
                             column: AdhocMetricColumn = None,
@@ -78,7 +81,6 @@ class ColumnsMixin:
             column.expressionType = FilterExpressionType.CUSTOM_SQL
 
 
-@runtime_checkable
 class SupportsOrderby(Protocol):
     # This is a protocol that defines the expected structure of classes that have metric.
     orderby: SerializableOptional[List[OrderByTyping]]
@@ -87,7 +89,7 @@ class SupportsOrderby(Protocol):
 class OrderByMixin:
     def _add_simple_orderby(self, column_name: str,
                             sort_ascending: bool):
-        self.orderby.append((column_name, sort_ascending))
+        self.orderby.append((intern_str(column_name), sort_ascending))
 
     def _add_custom_orderby(self, label: str,
                             sort_ascending: bool,
@@ -119,13 +121,14 @@ class QuerySerializableModel(SerializableModel, MetricsListMixin, ColumnsMixin,
 
     def __post_init__(self):
         super().__post_init__()
-        if not self.metrics:
+        # The list fields already come from default_factory; only an explicit None needs replacing.
+        if self.metrics is None:
             self.metrics:List[Metric] = []
-        if not self.orderby:
+        if self.orderby is None:
             self.orderby:List[OrderByTyping] = []
-        if not self.columns:
+        if self.columns is None:
             self.columns:List[Metric] = []
-        if not self.row_limit == 0:
+        if self.row_limit is None:
             self.row_limit = 100
 
     def validate(self, data: dict):
@@ -140,13 +143,16 @@ class QuerySerializableModel(SerializableModel, MetricsListMixin, ColumnsMixin,
     def _add_simple_filter(self, column_name: Column,
                            value: FilterValues,
                            operator: FilterOperatorType = FilterOperatorType.EQUALS) -> None:
-        query_filter_clause = QueryFilterClause(col=column_name, val=value, op=operator)
+        query_filter_clause = QueryFilterClause(col=intern_str(column_name), val=value, op=operator)
         self.filters.append(query_filter_clause)
 
+    def _add_simple_filters_bulk(self, filters: Sequence[tuple[Column, FilterValues, FilterOperatorType]]) -> None:
+        self.filters.extend([QueryFilterClause(col=intern_str(column_name), val=value, op=operator)
+                             for column_name, value, operator in filters])
+
     def _add_extra_where(self, sql: str):
-        if self.extras.where:
-            self.extras.where = f'{self.extras.where} AND '
-        self.extras.where = self.extras.where + f'({sql})'
+        where = self.extras.where
+        self.extras.where = f'{where} AND ({sql})' if where else f'({sql})'
 
     def _add_extra_having(self, sql: str):
         raise NotImplementedError
@@ -1,6 +1,5 @@
-from abc import abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import List, Sequence
 
 from supersetapiplus.base.base import SerializableModel, object_field
 from supersetapiplus.base.datasource import DataSource
@@ -22,9 +21,14 @@ class QueryContext(SerializableModel):
     queries: List[QuerySerializableModel] = object_field(cls=QuerySerializableModel, default_factory=list)
     form_data: FormData = object_field(cls=FormData, default_factory=FormData)
 
-    @abstractmethod
-    def _default_query_object_class(self) -> type[QuerySerializableModel]:
-        raise NotImplementedError()
+    # Query object class used by first_queries; every subclass must define it.
+    # Left unannotated so it does not become a dataclass (pseudo-)field.
+    _query_object_class = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not isinstance(getattr(cls, '_query_object_class', None), type):
+            raise TypeError(f'{cls.__name__} must define the _query_object_class class attribute.')
 
     def __post_init__(self):
         self._automatic_order: OrderBy = None
@@ -49,16 +53,13 @@ class QueryContext(SerializableModel):
 
     @property
     def first_queries(self):
-        if self.queries and len(self.queries) > 1:
+        queries = self.queries
+        if not queries:
+            self.queries = queries = [self._query_object_class()]
+        elif len(queries) > 1:
             raise ChartValidationError("""There are more than one query in the queries list.
                                        We don't know which one to include the filter in.""")
-        if not self.queries:
-            QueryObjectClass = self._default_query_object_class()
-            self.queries: List[QueryObjectClass] = []
-        if len(self.queries) == 0:
-            QueryObjectClass = self._default_query_object_class()
-            self.queries.append(QueryObjectClass())
-        return self.queries[-1]
+        return queries[-1]
 
     def _add_simple_metric(self, metric: str, automatic_order: OrderBy):
         self._automatic_order = automatic_order
@@ -67,6 +68,17 @@ class QueryContext(SerializableModel):
         if automatic_order.automate:
             self._add_simple_orderby(metric, automatic_order.sort_ascending)
 
+    def _add_simple_metrics(self, metrics: Sequence[str], automatic_order: OrderBy):
+        self._automatic_order = automatic_order
+        form_data = self.form_data
+        first_queries = self.first_queries
+        automate = automatic_order.automate
+        for metric in metrics:
+            form_data._add_simple_metric(metric, automatic_order)
+            first_queries._add_simple_metric(metric, automatic_order)
+            if automate:
+                first_queries._add_simple_orderby(metric, automatic_order.sort_ascending)
+
     def _add_custom_metric(self, label: str,
                            automatic_order: OrderBy,
                            column: AdhocMetricColumn = None,
@@ -93,6 +105,10 @@ class QueryContext(SerializableModel):
         self.form_data._add_simple_groupby(column_name)
         self.first_queries._add_simple_columns(column_name)
 
+    def _add_simple_groupby_bulk(self, column_names: Sequence[str]):
+        self.form_data._add_simple_groupby_bulk(column_names)
+        self.first_queries._add_simple_columns_bulk(column_names)
+
     def _add_custom_groupby(self, label: str,
                             column: AdhocMetricColumn = None,
                             sql_expression: str = None,
@@ -110,6 +126,15 @@ class QueryContext(SerializableModel):
                                    operator=operator)
         self.first_queries._add_simple_filter(column_name, value, operator)
 
+    def _add_simple_filters_bulk(self, filters: Sequence[tuple[str, str, FilterOperatorType]]) -> None:
+        for column_name, value, operator in filters:
+            self.form_data._adhoc_filters(expression_type=FilterExpressionType.SIMPLE,
+                                          clause=FilterClausesType.WHERE,
+                                          subject=column_name,
+                                          comparator=value,
+                                          operator=operator)
+        self.first_queries._add_simple_filters_bulk(filters)
+
 
     def _add_extra_where(self, sql: str):
         self.form_data._adhoc_filters(expression_type=FilterExpressionType.CUSTOM_SQL,
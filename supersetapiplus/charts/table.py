@@ -1,6 +1,6 @@
 """Charts."""
-from dataclasses import dataclass, field
-from typing import List, Dict
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Sequence
 
 from supersetapiplus.base.base import object_field
 from supersetapiplus.charts.charts import Chart
@@ -11,6 +11,7 @@ from supersetapiplus.charts.query_context import QueryContext
 from supersetapiplus.charts.types import ChartType, DateFormatType, QueryModeType, TimeGrain, MetricType, ColumnType
 from supersetapiplus.exceptions import ValidationError
 from supersetapiplus.typing import SerializableOptional
+from supersetapiplus.utils import intern_str
 
 
 # class TableAdhocMetric(AdhocMetric):
@@ -22,10 +23,10 @@ from supersetapiplus.typing import SerializableOptional
 
 
 @dataclass
-class TableOption(Option, MetricsListMixin):
+class TableOption(MetricsListMixin, Option):
     row_limit: int = 1000
-    viz_type: ChartType = field(default_factory=lambda: ChartType.TABLE)
-    query_mode: QueryModeType = field(default_factory=lambda: QueryModeType.AGGREGATE)
+    viz_type: ChartType = ChartType.TABLE
+    query_mode: QueryModeType = QueryModeType.AGGREGATE
 
     order_by_cols: List = field(default_factory=list)
 
@@ -34,7 +35,7 @@ class TableOption(Option, MetricsListMixin):
     order_desc: bool = False
     show_totals: SerializableOptional[bool] = False
 
-    table_timestamp_format: DateFormatType = field(default_factory=lambda: DateFormatType.SMART_DATE)
+    table_timestamp_format: DateFormatType = DateFormatType.SMART_DATE
     page_length: SerializableOptional[int] = None
     include_search: SerializableOptional[bool] = False
     show_cell_bars: bool = True
@@ -54,7 +55,7 @@ class TableOption(Option, MetricsListMixin):
 
     def __post_init__(self):
         super().__post_init__()
-        if not self.metrics:
+        if self.metrics is None:
             self.metrics: List[Metric] = []
         if self.server_page_length == 0:
             self.server_page_length = 10
@@ -69,6 +70,13 @@ class TableOption(Option, MetricsListMixin):
         self.column_config[label] = column_config
 
 
+def _metric_signature(metric: Metric):
+    # Simple metrics are plain strings; AdhocMetric is unhashable, so compare it by its signature.
+    if isinstance(metric, AdhocMetric):
+        return metric.signature()
+    return metric
+
+
 @dataclass
 class TableFormData(TableOption):
     pass
@@ -80,50 +88,53 @@ class TableQueryObject(QuerySerializableModel):
     granularity: SerializableOptional[str] = None
     # applied_time_extras: List[str] = field(default_factory=list)
 
-    def _add_simple_metric(self, metric:str, automatic_order: OrderBy):
-        #In the table the option is sort descending
-        automatic_order.sort_ascending = not automatic_order.sort_ascending
-        super()._add_simple_metric(metric, automatic_order)
+
+@dataclass
+class TableQueryContext(QueryContext):
+    _query_object_class = TableQueryObject
+
+    form_data: TableFormData = object_field(cls=TableFormData, default_factory=TableFormData)
+    queries: List[TableQueryObject] = object_field(cls=QuerySerializableModel, default_factory=list)
+
+    @staticmethod
+    def _table_order(automatic_order: OrderBy) -> OrderBy:
+        #In the table the option is sort descending; flip a copy so the caller's OrderBy is left untouched
+        if automatic_order is None:
+            return None
+        return replace(automatic_order, sort_ascending=not automatic_order.sort_ascending)
+
+    def _add_simple_metric(self, metric: str, automatic_order: OrderBy):
+        super()._add_simple_metric(metric, self._table_order(automatic_order))
+
+    def _add_simple_metrics(self, metrics: Sequence[str], automatic_order: OrderBy):
+        super()._add_simple_metrics(metrics, self._table_order(automatic_order))
 
     def _add_custom_metric(self, label: str,
                            automatic_order: OrderBy,
                            column: AdhocMetricColumn = None,
                            sql_expression: str = None,
                            aggregate: MetricType = None):
-        #In the table the option is sort descending
-        automatic_order.sort_ascending = not automatic_order.sort_ascending
-        super()._add_custom_metric(label, automatic_order, column, sql_expression, aggregate)
-
-
-@dataclass
-class TableQueryContext(QueryContext):
-    form_data: TableFormData = object_field(cls=TableFormData, default_factory=TableFormData)
-    queries: List[TableQueryObject] = object_field(cls=QuerySerializableModel, default_factory=list)
+        super()._add_custom_metric(label, self._table_order(automatic_order), column, sql_expression, aggregate)
 
     def validate(self, data: dict):
         super().validate(data)
-        if self.form_data.metrics or self.queries:
-            equals = False
-            counter = 0
-            for form_data_metric in self.form_data.metrics:
-                for query in self.queries:
-                    for query_metric in query.metrics:
-                        if form_data_metric == query_metric:
-                            counter+=1
-            if counter == len(self.form_data.metrics):
-                equals = True
-
-            if not equals:
+        if self.form_data.metrics:
+            query_metrics = {_metric_signature(query_metric)
+                             for query in self.queries
+                             for query_metric in query.metrics}
+            missing = [form_data_metric for form_data_metric in self.form_data.metrics
+                       if _metric_signature(form_data_metric) not in query_metrics]
+
+            if missing:
                 raise ValidationError(message='The metrics definition in formdata is not included in queries.metrics.',
                                       solution="We recommend using one of the Chart class's add_simple_metric or add_custom_metric methods to ensure data integrity.")
 
-    def _default_query_object_class(self) -> type[QuerySerializableModel]:
-        return TableQueryObject
-
 
 @dataclass
 class TableChart(Chart):
-    viz_type: ChartType = field(default_factory=lambda: ChartType.TABLE)
+    _default_option_class = TableOption
+
+    viz_type: ChartType = ChartType.TABLE
     params: TableOption = object_field(cls=TableOption, default_factory=TableOption)
     query_context: TableQueryContext = object_field(cls=TableQueryContext, default_factory=TableQueryContext)
 
@@ -132,8 +143,9 @@ class TableChart(Chart):
                           column_config: ColumnConfig = None):
         super().add_simple_metric(metric, automatic_order)
         if column_config:
-            self.params._add_column_config(str(metric), column_config)
-            self.query_context.form_data._add_column_config(str(metric), column_config)
+            label = intern_str(str(metric))
+            self.params._add_column_config(label, column_config)
+            self.query_context.form_data._add_column_config(label, column_config)
 
 
     def add_custom_metric(self, label: str,
@@ -144,9 +156,6 @@ class TableChart(Chart):
                             column_config: ColumnConfig = None):
         super().add_custom_metric(label, automatic_order, column, sql_expression, aggregate)
         if column_config:
+            label = intern_str(label)
             self.params._add_column_config(label, column_config)
-            self.query_context.form_data._add_column_config(label, column_config)
-
-    @classmethod
-    def _default_option_class(cls) -> type[Option]:
-        return TableOption
\ No newline at end of file
+            self.query_context.form_data._add_column_config(label, column_config)
\ No newline at end of file
@@ -1,9 +1,13 @@
 """A Superset REST Api Client."""
+import base64
 import getpass
+import hashlib
 import json
 import logging
-import urllib.parse
-from typing import List
+import os
+import socket
+import time
+from typing import List, Optional
 
 from supersetapiplus.query_string import QueryStringFilter
 
@@ -13,9 +17,15 @@ except ImportError:  # pragma: no cover
     # Python<3.8
     from cached_property import cached_property
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 import requests.adapters
 import requests.exceptions
 import requests_oauthlib
+from urllib3.connection import HTTPConnection
 
 from supersetapiplus.assets import Assets
 from supersetapiplus.base.base import raise_for_status
@@ -28,6 +38,40 @@ from supersetapiplus.saved_queries import SavedQueries
 
 logger = logging.getLogger(__name__)
 
+# Pool and retry policy for the client session. Retries cover idempotent methods only
+# (urllib3 default), and the last response is returned so raise_for_status still reports it.
+_POOL_MAXSIZE = 32
+_RETRY = requests.adapters.Retry(total=3, backoff_factor=0.2, status_forcelist=frozenset((429, 502, 503, 504)),
+                                 raise_on_status=False)
+
+# Small JSON POSTs must not wait on Nagle/delayed-ACK; keepalive lets idle pooled sockets be
+# probed instead of failing on first reuse. urllib3 already sets TCP_NODELAY by default, but we
+# keep it explicit so a changed default does not silently bring the stall back.
+_SOCKET_OPTIONS = list(dict.fromkeys(HTTPConnection.default_socket_options + [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]))
+
+# A cached access token is only reused while it has at least this many seconds left.
+_TOKEN_EXPIRATION_MARGIN = 30
+
+
+def _response_json(response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _jwt_expiration(token: str) -> Optional[float]:
+    """Return the exp claim of a JWT, or None when it cannot be read."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
 
 class SupersetClient:
     """A Superset Client."""
@@ -46,28 +90,66 @@ class SupersetClient:
         password=None,
         provider="db",
         verify=True,
+        token_cache_dir=None,
+        pool_maxsize=_POOL_MAXSIZE,
     ):
         self.host = host
         self.base_url = self.join_urls(host, "api/v1")
-        self._http_protocol = urllib.parse.urlparse(self.base_url).scheme
+        scheme, separator, _ = self.base_url.partition('://')
+        self._http_protocol = scheme.lower() if separator else ''
 
         self.username = username
         self._password = password
         self.provider = provider
         self._verify = verify
+        self._token_cache_dir = token_cache_dir
+        self._pool_maxsize = pool_maxsize
+
+    # Related Objects, built on first use
+    @cached_property
+    def assets(self):
+        return self.assets_cls(self)
+
+    @cached_property
+    def dashboards(self):
+        return self.dashboards_cls(self)
 
-        # Related Objects
-        self.assets = self.assets_cls(self)
-        self.dashboards = self.dashboards_cls(self)
-        self.charts = self.charts_cls(self)
-        self.datasets = self.datasets_cls(self)
-        self.databases = self.databases_cls(self)
-        self.saved_queries = self.saved_queries_cls(self)
+    @cached_property
+    def charts(self):
+        return self.charts_cls(self)
+
+    @cached_property
+    def datasets(self):
+        return self.datasets_cls(self)
+
+    @cached_property
+    def databases(self):
+        return self.databases_cls(self)
+
+    @cached_property
+    def saved_queries(self):
+        return self.saved_queries_cls(self)
 
     @cached_property
     def _token(self):
         return self.authenticate()
 
+    @cached_property
+    def _http_session(self):
+        # Single connection pool shared by the login request and the authenticated session.
+        if self._http_protocol == 'https':
+            session = requests_oauthlib.OAuth2Session()
+            session.verify = self._verify
+        else:
+            session = requests.Session()
+
+        adapter = NoDelayHTTPAdapter(pool_maxsize=self._pool_maxsize, max_retries=_RETRY)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not session.verify:
+            session.mount(self.host, adapter=NoVerifyHTTPAdapter(pool_maxsize=self._pool_maxsize, max_retries=_RETRY))
+        return session
+
     @cached_property
     def session(self):
         logger.debug(f'client.session ...')
@@ -78,7 +160,7 @@ class SupersetClient:
 
     def _session_http(self):
         logger.debug(f'client.__session_http ...')
-        session = requests.Session()
+        session = self._http_session
         session.headers['Authorization'] = f"Bearer {self._token['access_token']}"
 
         # Update headers
@@ -94,13 +176,10 @@ class SupersetClient:
 
     def _session_oath2(self):
         logger.debug(f'client._session_oath2 ...')
-        session = requests_oauthlib.OAuth2Session(token=self._token)
+        session = self._http_session
+        session.token = self._token
         session.hooks["response"] = [self.token_refresher]
 
-        session.verify = self._verify
-        if not session.verify:
-            session.mount(self.host, adapter=NoVerifyHTTPAdapter())
-
         # Update headers
         session.headers.update({
             "X-CSRFToken": f"{self.csrf_token(session)}",
@@ -144,16 +223,22 @@ class SupersetClient:
         # Try authentication and define session
         if self.username is None:
             self.username = getpass.getuser()
+
+        token = self._load_cached_token()
+        if token:
+            logger.debug(f'client.authenticate using cached token')
+            return token
+
         if self._password is None:
             self._password = getpass.getpass()
 
-        # No need for session here because we are before authentication
+        # Not authenticated yet, but reuse the pooled session so the connection carries over
         headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
 
-        response = requests.post(
+        response = self._http_session.post(
             self.login_endpoint,
             headers=headers,
             json={
@@ -163,14 +248,67 @@ class SupersetClient:
                 "refresh": "true",
             },
         )
-        raise_for_status(response)
+        try:
+            raise_for_status(response)
+        except Exception:
+            # Login refused: drop whatever token is cached for these credentials.
+            self._invalidate_cached_token()
+            raise
+
+        token = _response_json(response)
+        logger.debug(f'client.authenticate response: {token}')
+        self._save_cached_token(token)
+        return token
 
-        logger.debug(f'client.authenticate response: {response.json()}')
-        return response.json()
+    @property
+    def _token_cache_file(self) -> Optional[str]:
+        if not self._token_cache_dir:
+            return None
+        key = hashlib.sha256(f'{self.host}|{self.username}'.encode()).hexdigest()[:32]
+        return os.path.join(os.path.expanduser(self._token_cache_dir), f'{key}.json')
+
+    def _load_cached_token(self) -> Optional[dict]:
+        path = self._token_cache_file
+        if not path:
+            return None
+        try:
+            with open(path) as f:
+                token = json.load(f)
+        except (OSError, ValueError):
+            return None
+        exp = _jwt_expiration(token.get('access_token')) if isinstance(token, dict) else None
+        if exp is None or exp - time.time() <= _TOKEN_EXPIRATION_MARGIN:
+            return None
+        return token
+
+    def _save_cached_token(self, token: dict) -> None:
+        path = self._token_cache_file
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                # The mode above only applies on creation; tighten a pre-existing file before writing.
+                os.chmod(path, 0o600)
+                json.dump(token, f)
+        except OSError as e:
+            logger.warning(f'client could not write the token cache {path}: {e}')
+
+    def _invalidate_cached_token(self) -> None:
+        path = self._token_cache_file
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
     def token_refresher(self, r, *args, **kwargs):
         """A requests response hook for token refresh."""
         if r.status_code == 401:
+            # Expired, revoked or otherwise rejected: the token on disk must not be reused.
+            self._invalidate_cached_token()
+
             # Check if token has expired
             try:
                 msg = r.json().get("msg")
@@ -189,6 +327,7 @@ class SupersetClient:
             if "refresh_token" not in new_token:
                 new_token["refresh_token"] = refresh_token
             self.session.token = new_token
+            self._save_cached_token(new_token)
 
             # Set new authorization header
             bearer = f"Bearer {new_token['access_token']}"
@@ -218,7 +357,7 @@ class SupersetClient:
             payload["queryLimit"] = query_limit
         response = self.post(self._sql_endpoint, json=payload)
         raise_for_status(response)
-        result = response.json()
+        result = _response_json(response)
         display_limit = result.get("displayLimit", None)
         display_limit_reached = result.get("displayLimitReached", False)
         if display_limit_reached:
@@ -231,34 +370,56 @@ class SupersetClient:
             )
         return result["columns"], result["data"]
 
+    def run_dataframe(self, database_id, query, query_limit=None):
+        """Sends SQL queries to Superset and returns the resulting dataset as a DataFrame.
+
+        :param database_id: Database ID of DB to query
+        :type database_id: int
+        :param query: Valid SQL Query
+        :type query: str
+        :param query_limit: limit size of resultset, defaults to -1
+        :type query_limit: int, optional
+        :return: Resultset, one column per result column
+        :rtype: pandas.DataFrame
+        """
+        import pandas as pd
+
+        columns, data = self.run(database_id, query, query_limit)
+        return pd.DataFrame.from_records(data, columns=[column["name"] for column in columns])
+
     @property
     def password(self) -> str:
         return "*" * len(self._password)
 
-    @property
+    @cached_property
     def login_endpoint(self) -> str:
         return self.join_urls(self.base_url, "security/login")
 
-    @property
+    @cached_property
     def refresh_endpoint(self) -> str:
         return self.join_urls(self.base_url, "security/refresh")
 
-    @property
+    @cached_property
+    def _csrf_endpoint(self) -> str:
+        return self.join_urls(self.base_url, "security/csrf_token/")
+
+    @cached_property
     def _sql_endpoint(self) -> str:
         return self.join_urls(self.host, "superset/sql_json/")
 
     def csrf_token(self, session) -> str:
         # Get CSRF Token
         csrf_response = session.get(
-            self.join_urls(self.base_url, "security/csrf_token/"),
+            self._csrf_endpoint,
             headers={"Referer": f"{self.base_url}"},
         )
         logger.debug(f'client.csrf_token Check CSRF ...')
 
         raise_for_status(csrf_response)  # Check CSRF Token went well
 
-        logger.debug(f'client.csrf_token CSRF response: {csrf_response.json().get("result")}')
-        return csrf_response.json().get("result")
+        csrf_token = _response_json(csrf_response).get("result")
+        logger.debug(f'client.csrf_token CSRF response: {csrf_token}')
+        return csrf_token
 
     def find(self, url, filter:QueryStringFilter, columns:List[str]=[], page_size: int = 100, page: int = 0):
         """Find and get objects from api."""
@@ -268,17 +429,29 @@ class SupersetClient:
             "filters": filter.filters,
             "columns" :columns
         }
-        logger.debug(f'client.find query string: {query}')
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f'client.find query string: {query}')
 
         params = {"q": json.dumps(query)}
 
         response = self.get(url, params=params)
-        logger.debug(f'client.find response: {response.json()}')
         raise_for_status(response)
-        return response.json()
+        result = _response_json(response)
+        if debug:
+            logger.debug(f'client.find response: {result}')
+        return result
+
+
+class NoDelayHTTPAdapter(requests.adapters.HTTPAdapter):
+    """An HTTP adapter whose sockets use TCP_NODELAY and SO_KEEPALIVE"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
 
 
-class NoVerifyHTTPAdapter(requests.adapters.HTTPAdapter):
+class NoVerifyHTTPAdapter(NoDelayHTTPAdapter):
     """An HTTP adapter that ignores TLS validation errors"""
 
     def cert_verify(self, conn, url, verify, cert):
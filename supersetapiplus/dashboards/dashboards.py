@@ -7,9 +7,15 @@ from supersetapiplus.dashboards.itemposition import ItemPosition
 from supersetapiplus.dashboards.metadata import Metadata
 from supersetapiplus.dashboards.metadataposition import Metadataposition
 from supersetapiplus.dashboards.nodeposisition import RowNodePosition
-from supersetapiplus.exceptions import DashboardValidationError
+from supersetapiplus.exceptions import DashboardValidationError, NotFound, MultipleFound
+from supersetapiplus.query_string import QueryStringFilter
 from supersetapiplus.typing import SerializableNotToJson
 
+# Superset (FAB_API_MAX_PAGE_SIZE) caps listings at 100 rows per page by default; a server may cap lower.
+_CHARTS_PAGE_SIZE = 100
+# Slice names per 'in' filter, keeping the rison query string well below URL length limits.
+_CHARTS_NAMES_PER_QUERY = 50
+
 
 def defult_metadata():
     return Metadata()
@@ -98,10 +104,35 @@ class Dashboard(SerializableModel):
     def get_charts(self) -> List[int]:
         """Get chart objects"""
         #http://localhost:8088/api/v1/dashboard/21/charts
+        # A chart can be listed more than once; fetch and return it once, in first-seen order.
+        slice_names = list(dict.fromkeys(self.charts_slice_names))
+        if not slice_names:
+            return []
+
+        # Filtered listings by batches of slice names instead of a find_one request per chart.
+        charts_factory = self._factory.client.charts
+        found = {}
+        for start in range(0, len(slice_names), _CHARTS_NAMES_PER_QUERY):
+            filter = QueryStringFilter()
+            filter.add('slice_name', 'in', slice_names[start:start + _CHARTS_NAMES_PER_QUERY])
+            page = 0
+            # Only an empty page ends the listing: the server may return fewer rows than requested.
+            while True:
+                objects = charts_factory.find(filter, page_size=_CHARTS_PAGE_SIZE, page=page)
+                if not objects:
+                    break
+                for chart in objects:
+                    found.setdefault(chart.slice_name, []).append(chart)
+                page += 1
+
         charts = []
-        for slice_name in self.charts_slice_names:
-            c = self._factory.client.charts.find_one(slice_name=slice_name)
-            charts.append(c)
+        for slice_name in slice_names:
+            matches = found.get(slice_name, [])
+            if len(matches) == 0:
+                raise NotFound(f"No Chart found with slice_name {slice_name}")
+            if len(matches) > 1:
+                raise MultipleFound(f"Multiple Chart found with slice_name {slice_name}")
+            charts.append(matches[0])
         return charts
 
     def delete(self, exclude_charts:bool = False) -> bool:
@@ -47,12 +47,11 @@ class Metadata(SerializableModel):
     default_filters: Dict = field(default_factory=dict)
 
     def add_chart(self, chart):
-        chart_configuration = ChartConfiguration(id=chart.id)
-        if self.global_chart_configuration.chartsInScope:
-            for chart_id in self.global_chart_configuration.chartsInScope:
-                if chart_id != chart.id:
-                    chart_configuration.crossFilters.chartsInScope.append(chart_id)
-        self.chart_configuration[str(chart.id)] = chart_configuration
-
-        self.global_chart_configuration.chartsInScope.append(chart.id)
+        chart_id = chart.id
+        charts_in_scope = self.global_chart_configuration.chartsInScope
+        chart_configuration = ChartConfiguration(id=chart_id)
+        chart_configuration.crossFilters.chartsInScope = [id_ for id_ in charts_in_scope if id_ != chart_id]
+        self.chart_configuration[str(chart_id)] = chart_configuration
+
+        charts_in_scope.append(chart_id)
 
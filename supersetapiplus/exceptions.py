@@ -19,19 +19,26 @@ class QueryLimitReached(Exception):
 class BadRequestError(HTTPError):
     def __init__(self, *args, **kwargs):
         self.message = kwargs.pop("message", None)
+        self._str = None
         super().__init__(*args, **kwargs)
 
     def __str__(self):
-        return json.dumps(self.message, indent=4)
+        # Formatted once; logging and traceback chains may stringify the same error many times.
+        if self._str is None:
+            self._str = json.dumps(self.message, indent=4)
+        return self._str
 
 
 class ComplexBadRequestError(HTTPError):
     def __init__(self, *args, **kwargs):
         self.errors = kwargs.pop("errors", None)
+        self._str = None
         super().__init__(*args, **kwargs)
 
     def __str__(self):
-        return json.dumps(self.errors, indent=4)
+        if self._str is None:
+            self._str = json.dumps(self.errors, indent=4)
+        return self._str
 
 
 class ItemPositionValidationError(Exception):
@@ -18,8 +18,9 @@ class SavedQuery(SerializableModel):
 
     @classmethod
     def from_json(cls, json: dict):
-        res = super().from_json(json)
+        # Read before the base class moves unknown keys such as "database" into _extra_fields.
         database = json.get("database")
+        res = super().from_json(json)
         if database:
             res.db_id = database.get("id")
         return res
@@ -1,39 +1,68 @@
+import inspect
 import logging
 import re
+import sys
 import unicodedata
+from functools import lru_cache
 
 import shortuuid
 
 logger = logging.getLogger(__name__)
 
+_NOT_WORD_RE = re.compile('[^A-Za-z0-9_]+')
+_SHORT_UUID = shortuuid.ShortUUID()
+
 def normalize_str(text: str):
-    return re.sub('[^A-Za-z0-9_]+', '', unicodedata.normalize('NFKD', text.replace(' ', '_').lower()))
+    return _NOT_WORD_RE.sub('', unicodedata.normalize('NFKD', text.replace(' ', '_').lower()))
+
+def intern_str(value):
+    return sys.intern(value) if type(value) is str else value
 
 def generate_uuid(_type):
-    return f"{_type}-{shortuuid.ShortUUID().random(length=10)}"
+    return f"{_type}-{_SHORT_UUID.random(length=10)}"
 
 def dict_compare(d1, d2):
-    d1_keys = set(d1.keys())
-    d2_keys = set(d2.keys())
-    intersect_keys = d1_keys.intersection(d2_keys)
+    d1_keys = d1.keys()
+    d2_keys = d2.keys()
     added = d1_keys - d2_keys
     removed = d2_keys - d1_keys
-    modified = {o: (d1[o], d2[o]) for o in intersect_keys if d1[o] != d2[o]}
-    same = set(o for o in intersect_keys if d1[o] == d2[o])
+    modified = {}
+    same = set()
+    # One pass over the shared keys, each pair compared once.
+    for o in d1_keys & d2_keys:
+        value1 = d1[o]
+        value2 = d2[o]
+        if value1 != value2:
+            modified[o] = (value1, value2)
+        else:
+            same.add(o)
     return added, removed, modified, same
 
 def dict_hash(my_dict):
-    sorted_items = sorted(my_dict.items())
-    hashed_items = [hash(item) for item in sorted_items]
-    return hash(tuple(hashed_items))
+    # frozenset hashing is order-independent, so the items need no sorting.
+    return hash(frozenset(my_dict.items()))
+
+def _is_class_callable(cls, attr):
+    # Methods, class/static methods and nested classes; properties are not callable and stay.
+    static = inspect.getattr_static(cls, attr, None)
+    return callable(static) or isinstance(static, (classmethod, staticmethod))
+
+@lru_cache(maxsize=None)
+def _public_class_attrs(cls):
+    return frozenset(attr for attr in dir(cls) if not attr.startswith("_") and not _is_class_callable(cls, attr))
 
 def compare_objects(obj1, obj2):
     logger.debug(f'compare_objects: {type(obj1)} vs {type(obj2)}')
-    for attr in dir(obj1):
+    # Same names dir(obj1) would list, minus private ones, without rebuilding the class part per call.
+    attrs = set(_public_class_attrs(type(obj1)))
+    attrs.update(attr for attr in getattr(obj1, '__dict__', ()) if not attr.startswith("_"))
+    for attr in sorted(attrs):
         try:
-            if not callable(getattr(obj1, attr)) and not attr.startswith("_"):
-                if getattr(obj1, attr) != getattr(obj2, attr):
-                    logger.debug(f'{attr}: {getattr(obj1, attr)} != {getattr(obj2, attr)}')
+            value1 = getattr(obj1, attr)
+            if not callable(value1):
+                value2 = getattr(obj2, attr)
+                if value1 != value2:
+                    logger.debug(f'{attr}: {value1} != {value2}')
                     return False
         except AttributeError as err:
             logger.exception(err)
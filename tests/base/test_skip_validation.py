@@ -0,0 +1,46 @@
+import pytest
+
+from supersetapiplus.base.base import SkipValidation, _skip_validation
+from supersetapiplus.saved_queries import SavedQuery
+
+
+def test_to_json_skips_validation():
+    saved_query = SavedQuery(label="my query")
+    with pytest.raises(NotImplementedError):
+        saved_query.to_json()
+
+    with SkipValidation():
+        assert saved_query.to_json()["label"] == "my query"
+
+    with pytest.raises(NotImplementedError):
+        saved_query.to_json()
+
+
+def test_nested_instances_restore_outer_state():
+    with SkipValidation():
+        with SkipValidation():
+            assert _skip_validation.get() is True
+        assert _skip_validation.get() is True
+    assert _skip_validation.get() is False
+
+
+def test_reentrant_instance_restores_outer_state():
+    skip = SkipValidation()
+    with skip:
+        with skip:
+            assert _skip_validation.get() is True
+        assert _skip_validation.get() is True
+    assert _skip_validation.get() is False
+
+    # The same instance can be used again afterwards.
+    with skip:
+        assert _skip_validation.get() is True
+    assert _skip_validation.get() is False
+
+
+def test_state_restored_after_exception():
+    skip = SkipValidation()
+    with pytest.raises(RuntimeError):
+        with skip:
+            raise RuntimeError()
+    assert _skip_validation.get() is False
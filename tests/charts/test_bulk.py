@@ -0,0 +1,62 @@
+import pytest
+
+from supersetapiplus.base.datasource import DataSource
+from supersetapiplus.charts.echarts_timeseries_bar import EchartsTimeseriesBarChart
+from supersetapiplus.charts.pie import PieChart
+from supersetapiplus.charts.table import TableChart
+from supersetapiplus.charts.types import FilterOperatorType
+
+CHART_CLASSES = [PieChart, TableChart, EchartsTimeseriesBarChart]
+
+
+def new_chart_pair(chart_class):
+    return (chart_class.instance(slice_name="single", datasource=DataSource(id=1)),
+            chart_class.instance(slice_name="single", datasource=DataSource(id=1)))
+
+
+def assert_same_output(single, bulk):
+    assert single.params.to_dict() == bulk.params.to_dict()
+    assert single.query_context.to_dict() == bulk.query_context.to_dict()
+
+
+@pytest.mark.parametrize("chart_class", CHART_CLASSES)
+def test_add_simple_dimensions(chart_class):
+    columns = ["state", "city", "state"]
+    single, bulk = new_chart_pair(chart_class)
+
+    for column in columns:
+        single.add_simple_dimension(column)
+    bulk.add_simple_dimensions(iter(columns))
+
+    assert bulk.params.groupby == columns
+    assert_same_output(single, bulk)
+
+
+@pytest.mark.parametrize("chart_class", CHART_CLASSES)
+def test_add_simple_filters(chart_class):
+    filters = [("state", "RN", FilterOperatorType.EQUALS),
+               ("year", "2020", FilterOperatorType.GREATER_THAN_OR_EQUAL)]
+    single, bulk = new_chart_pair(chart_class)
+
+    for column_name, value, operator in filters:
+        single.add_simple_filter(column_name, value, operator)
+    bulk.add_simple_filters(iter(filters))
+
+    assert len(bulk.params.adhoc_filters) == len(filters)
+    assert_same_output(single, bulk)
+
+
+# EchartsTimeseriesBarChart has no metric support in this tree (its options define no metric methods).
+@pytest.mark.parametrize("chart_class, metrics", [
+    (PieChart, ["count"]),
+    (TableChart, ["count", "sum"]),
+])
+def test_add_simple_metrics(chart_class, metrics):
+    single, bulk = new_chart_pair(chart_class)
+
+    for metric in metrics:
+        single.add_simple_metric(metric)
+    bulk.add_simple_metrics(iter(metrics))
+
+    assert bulk.query_context.queries[0].metrics == metrics
+    assert_same_output(single, bulk)
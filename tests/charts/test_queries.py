@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from supersetapiplus.charts.echarts_timeseries_bar import TimeSeriesBarQueryObject
+from supersetapiplus.charts.pie import PieQueryObject
+
+QUERY_CLASSES = [PieQueryObject, TimeSeriesBarQueryObject]
+
+
+@pytest.mark.parametrize("query_class", QUERY_CLASSES)
+@pytest.mark.parametrize("row_limit", [0, 25, 500])
+def test_row_limit_is_preserved_on_round_trip(query_class, row_limit):
+    query = query_class(row_limit=row_limit)
+    assert query.row_limit == row_limit
+
+    data = json.loads(json.dumps(query.to_dict()))
+    assert query_class.from_json(data).row_limit == row_limit
+
+
+@pytest.mark.parametrize("query_class", QUERY_CLASSES)
+def test_missing_row_limit_defaults_to_100(query_class):
+    assert query_class().row_limit == 100
+    assert query_class(row_limit=None).row_limit == 100
@@ -0,0 +1,50 @@
+from supersetapiplus.base.datasource import DataSource
+from supersetapiplus.charts.metric import OrderBy
+from supersetapiplus.charts.table import TableChart
+
+
+def new_table_chart():
+    return TableChart.instance(slice_name="table", datasource=DataSource(id=1))
+
+
+def test_add_simple_metric_sorts_descending():
+    "The table flips the automatic order: ascending by default becomes descending"
+    chart = new_table_chart()
+    chart.add_simple_metric("count")
+
+    assert chart.query_context.queries[0].orderby == [("count", False)]
+    assert chart.params.metrics == ["count"]
+    assert chart.query_context.form_data.metrics == ["count"]
+
+
+def test_add_simple_metric_explicit_descending_sorts_ascending():
+    chart = new_table_chart()
+    chart.add_simple_metric("count", OrderBy(sort_ascending=False))
+
+    assert chart.query_context.queries[0].orderby == [("count", True)]
+
+
+def test_add_simple_metric_without_automatic_order():
+    chart = new_table_chart()
+    chart.add_simple_metric("count", OrderBy(automate=False))
+
+    assert chart.query_context.queries[0].orderby == []
+
+
+def test_add_custom_metric_sorts_descending():
+    chart = new_table_chart()
+    chart.add_custom_metric("total", sql_expression="SUM(value)")
+
+    ((metric, sort_ascending),) = chart.query_context.queries[0].orderby
+    assert metric.label == "total"
+    assert sort_ascending is False
+
+
+def test_caller_order_by_is_not_mutated():
+    order = OrderBy()
+    first, second = new_table_chart(), new_table_chart()
+    first.add_simple_metric("count", order)
+    second.add_simple_metric("count", order)
+
+    assert order == OrderBy(automate=True, sort_ascending=True)
+    assert first.query_context.queries[0].orderby == second.query_context.queries[0].orderby == [("count", False)]
@@ -0,0 +1,118 @@
+import base64
+import json
+import os
+import stat
+import time
+
+import pytest
+import requests
+
+from supersetapiplus.client import SupersetClient, _jwt_expiration
+from tests.conftest import SUPERSET_API_URI, SUPERSET_BASE_URI
+
+LOGIN_URL = f"{SUPERSET_API_URI}/security/login"
+REFRESH_URL = f"{SUPERSET_API_URI}/security/refresh"
+CSRF_URL = f"{SUPERSET_API_URI}/security/csrf_token/"
+CHART_URL = f"{SUPERSET_API_URI}/chart/1"
+
+
+def jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+def new_client(cache_dir):
+    return SupersetClient(SUPERSET_BASE_URI, "test", "test", token_cache_dir=str(cache_dir))
+
+
+@pytest.fixture
+def login(requests_mock):
+    token = {"access_token": jwt(time.time() + 3600), "refresh_token": "example_refresh_token"}
+    requests_mock.get(CSRF_URL, json={"result": "example_csrf_token"})
+    return requests_mock.post(LOGIN_URL, json=token), token
+
+
+def test_jwt_expiration():
+    exp = int(time.time()) + 60
+    assert _jwt_expiration(jwt(exp)) == exp
+    assert _jwt_expiration("not a jwt") is None
+    assert _jwt_expiration(None) is None
+
+
+def test_round_trip(tmp_path, login):
+    login_mock, token = login
+
+    first = new_client(tmp_path)
+    assert first._token == token
+
+    second = new_client(tmp_path)
+    assert second._token == token
+    assert login_mock.call_count == 1
+
+
+def test_cache_file_permissions(tmp_path, login):
+    client = new_client(tmp_path)
+    os.makedirs(tmp_path, exist_ok=True)
+    with open(client._token_cache_file, "w") as f:
+        f.write("{}")
+    os.chmod(client._token_cache_file, 0o644)
+
+    client._token
+
+    assert stat.S_IMODE(os.stat(client._token_cache_file).st_mode) == 0o600
+
+
+@pytest.mark.parametrize("exp", [time.time() - 60, time.time() + 5])
+def test_expired_token_is_not_reused(tmp_path, login, exp):
+    login_mock, token = login
+    client = new_client(tmp_path)
+    client._save_cached_token({"access_token": jwt(exp), "refresh_token": "old"})
+
+    assert client._token == token
+    assert login_mock.call_count == 1
+
+
+@pytest.mark.parametrize("content", ['{"foo": 1}', '{"access_token": null}', '["token"]', "not json"])
+def test_bad_cache_file_is_ignored(tmp_path, login, content):
+    login_mock, token = login
+    client = new_client(tmp_path)
+    with open(client._token_cache_file, "w") as f:
+        f.write(content)
+
+    assert client._token == token
+    assert login_mock.call_count == 1
+
+
+def test_rejected_token_invalidates_cache(tmp_path, login, requests_mock):
+    requests_mock.get(CHART_URL, status_code=401, json={"msg": "Signature verification failed"})
+    client = new_client(tmp_path)
+    client._token
+    assert os.path.exists(client._token_cache_file)
+
+    client.get(CHART_URL)
+
+    assert not os.path.exists(client._token_cache_file)
+
+
+def test_refreshed_token_is_saved(tmp_path, login, requests_mock):
+    refreshed = {"access_token": jwt(time.time() + 7200)}
+    requests_mock.post(REFRESH_URL, json=refreshed)
+    requests_mock.get(CHART_URL, [{"status_code": 401, "json": {"msg": "Token has expired"}},
+                                  {"json": {"result": {}}}])
+    client = new_client(tmp_path)
+
+    assert client.get(CHART_URL).status_code == 200
+
+    with open(client._token_cache_file) as f:
+        assert json.load(f) == {"access_token": refreshed["access_token"], "refresh_token": "example_refresh_token"}
+
+
+def test_login_failure_invalidates_cache(tmp_path, requests_mock):
+    requests_mock.post(LOGIN_URL, status_code=401, json={"message": "Not authorized"})
+    client = new_client(tmp_path)
+    client._save_cached_token({"access_token": jwt(time.time() - 60)})
+
+    with pytest.raises(requests.HTTPError):
+        client.authenticate()
+
+    assert not os.path.exists(client._token_cache_file)
@@ -0,0 +1,70 @@
+import json
+from urllib.parse import parse_qs
+
+import pytest
+
+import supersetapiplus.charts.table  # noqa: F401  registers the table chart class used by the listing
+from supersetapiplus.dashboards.dashboards import Dashboard
+from supersetapiplus.exceptions import MultipleFound, NotFound
+from tests.conftest import SUPERSET_API_URI
+
+
+def mock_chart_listing(requests_mock, slice_names, max_page_size):
+    """Serve chart/ like a Superset server whose page size is capped at max_page_size."""
+    queries = []
+
+    def listing(request, context):
+        query = json.loads(parse_qs(request.query)["q"][0])
+        queries.append(query)
+        wanted = query["filters"][0]["value"]
+        rows = [{"id": i, "slice_name": name, "viz_type": "table"}
+                for i, name in enumerate(slice_names) if name in wanted]
+        page_size = min(query["page_size"], max_page_size)
+        start = query["page"] * page_size
+        return {"count": len(rows), "result": rows[start:start + page_size]}
+
+    requests_mock.get(f"{SUPERSET_API_URI}/chart/", json=listing)
+    return queries
+
+
+def new_dashboard(client, slice_names):
+    dashboard = Dashboard(dashboard_title="dashboard")
+    dashboard._factory = client.dashboards
+    dashboard._charts_slice_names = slice_names
+    return dashboard
+
+
+def test_get_charts_multiple_pages(client, requests_mock):
+    names = [f"chart {i}" for i in range(250)]
+    queries = mock_chart_listing(requests_mock, names, max_page_size=100)
+
+    charts = new_dashboard(client, names).get_charts()
+
+    assert [chart.slice_name for chart in charts] == names
+    # Long name lists are split so the 'in' filter stays short.
+    assert max(len(query["filters"][0]["value"]) for query in queries) <= 50
+
+
+def test_get_charts_server_capped_page_size(client, requests_mock):
+    names = [f"chart {i}" for i in range(45)]
+    queries = mock_chart_listing(requests_mock, names, max_page_size=20)
+
+    charts = new_dashboard(client, names).get_charts()
+
+    assert [chart.slice_name for chart in charts] == names
+    # The first page came back short (20 < 100) and the listing still went on to the empty page.
+    assert [query["page"] for query in queries] == [0, 1, 2, 3]
+
+
+def test_get_charts_missing_chart(client, requests_mock):
+    mock_chart_listing(requests_mock, ["chart 1"], max_page_size=100)
+
+    with pytest.raises(NotFound):
+        new_dashboard(client, ["chart 1", "chart 2"]).get_charts()
+
+
+def test_get_charts_duplicated_slice_name(client, requests_mock):
+    mock_chart_listing(requests_mock, ["chart 1", "chart 1"], max_page_size=100)
+
+    with pytest.raises(MultipleFound):
+        new_dashboard(client, ["chart 1"]).get_charts()
@@ -0,0 +1,22 @@
+from supersetapiplus.saved_queries import SavedQuery
+
+
+def test_db_id_from_database_payload():
+    "The API nests the database; from_json must read its id before it lands in _extra_fields"
+    saved_query = SavedQuery.from_json({
+        "id": 7,
+        "label": "my query",
+        "sql": "SELECT 1",
+        "schema": "public",
+        "database": {"id": 3, "database_name": "examples"},
+    })
+
+    assert saved_query.db_id == 3
+    assert saved_query.label == "my query"
+    assert saved_query.extra_fields["database"] == {"id": 3, "database_name": "examples"}
+
+
+def test_db_id_without_database_payload():
+    saved_query = SavedQuery.from_json({"id": 7, "label": "my query", "db_id": 5})
+
+    assert saved_query.db_id == 5